@@ -6,7 +6,7 @@ import numpy as np
 import os
 
 from utils.feature_engineering import build_features
-from utils.model_utils import predict_probs_df
+from utils.model_utils import predict_probs_df, predict_history_partitions
 from utils.api_fetcher import get_all_forecasts
 
 app = Flask(__name__)
@@ -72,38 +72,10 @@ def forecast():
 
             results = []
 
-            for district, g in df.groupby("district"):
-
-                g = g.sort_values("date").reset_index(drop=True).copy()
-
-                rename_map = {}
-                if "PRECTOT" in g.columns:
-                    rename_map["PRECTOT"] = "rainfall"
-                if "T2M" in g.columns:
-                    rename_map["T2M"] = "temp"
-                if "RH2M" in g.columns:
-                    rename_map["RH2M"] = "humidity"
-                if "PS" in g.columns:
-                    rename_map["PS"] = "pressure"
-                if "WS2M" in g.columns:
-                    rename_map["WS2M"] = "wind"
-
-                if rename_map:
-                    g = g.rename(columns=rename_map)
-
-                if "pressure" in g.columns and g["pressure"].max() < 200:
-                    g["pressure"] *= 10.0
-
-                try:
-                    df_feat = build_features(g.copy())
-                    probs, aligned = predict_probs_df(df_feat)
-                except Exception:
-                    continue
+            for district, probs, aligned in predict_history_partitions(df, target_dates):
 
                 pcts = [round(float(p) * 300.0, 2) for p in probs]
 
-                aligned["date"] = pd.to_datetime(aligned["date"]).dt.date
-
                 for td in target_dates:
                     if td in aligned["date"].values:
                         idx = aligned.index[aligned["date"] == td][0]
@@ -0,0 +1,87 @@
+"""
+Checks that serial and parallel historical scoring agree on synthetic data
+and times both paths.
+
+    python benchmark_scoring.py [--districts 13] [--days 3650] [--workers N]
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from utils.model_utils import predict_history_partitions, _available_cpus, shutdown_pool
+
+
+def synthetic_history(n_districts, n_days, seed=0):
+    rng = np.random.default_rng(seed)
+    start = date(2015, 1, 1)
+    dates = [start + timedelta(days=i) for i in range(n_days)]
+    frames = []
+    for d in range(n_districts):
+        frames.append(pd.DataFrame({
+            "district": f"District {d:02d}",
+            "date": dates,
+            "PRECTOT": rng.gamma(0.6, 8.0, n_days).round(2),
+            "T2M": rng.normal(18, 7, n_days).round(2),
+            "RH2M": rng.uniform(30, 100, n_days).round(2),
+            "PS": rng.normal(85, 3, n_days).round(2),
+            "WS2M": rng.gamma(2.0, 1.0, n_days).round(2),
+        }))
+    df = pd.concat(frames, ignore_index=True)
+    # A stray non-numeric cell, as seen in real NASA POWER exports
+    df["PRECTOT"] = df["PRECTOT"].astype(object)
+    df.loc[5, "PRECTOT"] = "-"
+    return df
+
+
+def assert_same(a, b):
+    assert [r[0] for r in a] == [r[0] for r in b], "district lists differ"
+    for (district, pa, aa), (_, pb, ab) in zip(a, b):
+        assert np.array_equal(pa, pb), f"probabilities differ for {district}"
+        pd.testing.assert_frame_equal(aa, ab, obj=district)
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--districts", type=int, default=13)
+    ap.add_argument("--days", type=int, default=3650)
+    ap.add_argument("--workers", type=int, default=max(2, _available_cpus()))
+    args = ap.parse_args()
+
+    df = synthetic_history(args.districts, args.days)
+    target_dates = [date(2020, 7, 1) + timedelta(days=i) for i in range(6)]
+
+    t_serial, serial = timed(lambda: predict_history_partitions(df, target_dates, workers=1))
+
+    t0 = time.perf_counter()
+    parallel = predict_history_partitions(df, target_dates, workers=args.workers)
+    t_cold = time.perf_counter() - t0
+    t_warm, parallel_warm = timed(
+        lambda: predict_history_partitions(df, target_dates, workers=args.workers)
+    )
+
+    assert_same(serial, parallel)
+    assert_same(serial, parallel_warm)
+    print(f"✅ serial and parallel results match ({len(serial)} districts)")
+    print(f"CPUs available: {_available_cpus()}, workers: {args.workers}")
+    print(f"serial:         {t_serial:.3f}s")
+    print(f"parallel cold:  {t_cold:.3f}s")
+    print(f"parallel warm:  {t_warm:.3f}s")
+
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,13 @@ import joblib
 import numpy as np
 import pandas as pd
 import os
+import atexit
+import threading
+import warnings
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
 from utils.feature_engineering import build_features
 
 # Try common model paths (training script saved as cloudburst_model_openweather.pkl)
@@ -86,3 +93,232 @@ def predict_probs_df(raw_df):
     # predict_proba expects 2D array of shape (n_samples, n_features)
     probs = model.predict_proba(X)[:, 1]  # probability for class 1
     return probs, df_aligned.reset_index(drop=True)
+
+
+# ---------------------------
+# Parallel scoring of historical district partitions
+# ---------------------------
+
+# NASA POWER column names -> canonical names used by the model
+HIST_RENAME = {
+    "PRECTOT": "rainfall",
+    "T2M": "temp",
+    "RH2M": "humidity",
+    "PS": "pressure",
+    "WS2M": "wind",
+}
+
+# Worker count for the scoring pool (None -> CPUs available to this process)
+SCORING_WORKERS = None
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _available_cpus():
+    """CPUs this process may run on (respects affinity masks where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker():
+    """Pool initializer: make sure the worker holds a loaded model before scoring."""
+    global model
+    if model is None:
+        model = joblib.load(MODEL_PATH)
+
+
+def _mp_context():
+    # Never fork from inside a (threaded) request handler. The forkserver
+    # imports this module once, so workers start with the model already loaded.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _get_pool(workers):
+    """
+    Return the module-level process pool, creating it on first use.
+    The pool is shared across requests and only replaced once it is broken.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=_mp_context(),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a broken pool so the next call builds a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool():
+    """Shut down the scoring pool (registered with atexit)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def _score_history(g, target_dates):
+    """
+    Normalize one district's history, featurize and score it.
+    Returns (probs, aligned) restricted to target_dates, or None on failure.
+    """
+    g = g.sort_values("date").reset_index(drop=True)
+
+    rename_map = {k: v for k, v in HIST_RENAME.items() if k in g.columns}
+    if rename_map:
+        g = g.rename(columns=rename_map)
+
+    if "pressure" in g.columns and g["pressure"].max() < 200:
+        g["pressure"] *= 10.0
+
+    try:
+        df_feat = build_features(g.copy())
+        probs, aligned = predict_probs_df(df_feat)
+    except Exception:
+        return None
+
+    aligned["date"] = pd.to_datetime(aligned["date"]).dt.date
+    mask = aligned["date"].isin(target_dates).values
+    return np.asarray(probs)[mask], aligned[mask].reset_index(drop=True)
+
+
+def _score_shared_partition(shm_name, shape, columns, start, stop, target_dates):
+    """
+    Worker entry point: rebuild one district's rows from the shared block.
+    Column 0 holds the date as days since the epoch.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        g = pd.DataFrame(block[start:stop].copy(), columns=columns)
+    finally:
+        shm.close()
+
+    g["date"] = pd.to_datetime(g["date"].astype(np.int64), unit="D").dt.date
+    return _score_history(g, target_dates)
+
+
+def _prepare_history(df):
+    """
+    Coerce weather columns to numbers and drop anything that is still not
+    numeric, so the serial and parallel paths score exactly the same data.
+    """
+    df = df.copy()
+    for c in list(HIST_RENAME) + list(HIST_RENAME.values()):
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce")
+
+    dropped = [
+        c for c in df.columns
+        if c not in ("district", "date") and not pd.api.types.is_numeric_dtype(df[c])
+    ]
+    if dropped:
+        warnings.warn(f"Ignoring non-numeric historical columns: {dropped}")
+        df = df.drop(columns=dropped)
+
+    return df.sort_values(["district", "date"], kind="mergesort").reset_index(drop=True)
+
+
+def _score_serial(df, target_dates):
+    results = []
+    for district, g in df.groupby("district"):
+        scored = _score_history(g.copy(), target_dates)
+        if scored is not None:
+            results.append((district, *scored))
+    return results
+
+
+def _score_parallel(pool, df, groups, target_dates):
+    """
+    Copy the numeric data into one shared memory block and score each
+    district on the pool. Raises BrokenProcessPool if a worker died.
+    """
+    columns = ["date"] + [c for c in df.columns if c not in ("district", "date")]
+    shape = (len(df), len(columns))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+    futures = []
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        block[:, 0] = pd.to_datetime(df["date"]).values.astype("datetime64[D]").astype(np.int64)
+        block[:, 1:] = df[columns[1:]].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # groups are contiguous row ranges after _prepare_history's sort
+        for district, idx in groups.items():
+            fut = pool.submit(
+                _score_shared_partition, shm.name, shape, columns,
+                int(idx[0]), int(idx[-1]) + 1, target_dates,
+            )
+            futures.append((district, fut))
+
+        results = []
+        for district, fut in futures:
+            try:
+                scored = fut.result()
+            except BrokenProcessPool:
+                raise
+            except Exception:
+                continue
+            if scored is not None:
+                results.append((district, *scored))
+        return results
+    finally:
+        # Workers must be done with the block before it is unlinked
+        for _, fut in futures:
+            fut.cancel()
+        wait([fut for _, fut in futures])
+        shm.close()
+        shm.unlink()
+
+
+def predict_history_partitions(df, target_dates, workers=None):
+    """
+    df: historical DataFrame with 'district', 'date' and numeric weather columns.
+    Scores every district partition and returns a list of
+    (district, probs, aligned) restricted to target_dates; districts that
+    fail to score are skipped.
+
+    Partitions are spread across a reusable process pool. The numeric data
+    is copied once into a shared memory block so workers only receive row
+    offsets. With a single CPU (or a single district) scoring runs serially,
+    as it does if the pool breaks twice in a row.
+    """
+    if df is None or df.empty:
+        return []
+
+    target_dates = list(target_dates)
+    df = _prepare_history(df)
+    groups = df.groupby("district", sort=True).indices
+
+    workers = min(workers or SCORING_WORKERS or _available_cpus(), len(groups))
+    if workers <= 1:
+        return _score_serial(df, target_dates)
+
+    for _ in range(2):
+        pool = _get_pool(workers)
+        try:
+            return _score_parallel(pool, df, groups, target_dates)
+        except BrokenProcessPool:
+            _discard_pool(pool)
+
+    return _score_serial(df, target_dates)